@@ -7,23 +7,104 @@ detects the proper encoding to preserve Czech diacritics, and outputs clean
 Excel workbooks and UTF-8 CSV files.
 """
 
+from __future__ import annotations
+
 import argparse
 import csv
+import functools
+import importlib
+import io
+import json
 import os
+import struct
 import sys
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
-    from dbfread import DBF
-    import openpyxl
-    import chardet
-except ImportError as e:
-    print(f"Missing required package: {e}")
-    print("Please install: pip install dbfread openpyxl pandas chardet")
-    sys.exit(1)
+
+# Third-party packages are imported where they are used, so that --help
+# and argument errors do not pay for loading pandas and openpyxl
+REQUIRED_PACKAGES = ('pandas', 'dbfread', 'openpyxl')
+
+
+def check_dependencies() -> None:
+    """Exit with an install hint if a required package is missing."""
+    for module_name in REQUIRED_PACKAGES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"Missing required package: {e}")
+            print("Please install: pip install dbfread openpyxl pandas")
+            sys.exit(1)
+
+
+@functools.lru_cache(maxsize=None)
+def optional_import(module_name: str) -> Optional[ModuleType]:
+    """
+    Import an optional accelerator package, or return None if it is not installed.
+    
+    Used for xlsxwriter (constant-memory XLSX writer) and pyarrow (C++ CSV writer).
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+# Common Czech diacritics
+CZECH_CHARS = frozenset("áčďéěíňóřšťúůýžÁČĎÉĚÍŇÓŘŠŤÚŮÝŽ")
+
+# Common mojibake patterns when Czech is wrongly decoded
+MOJIBAKE_CHARS = frozenset(
+    "ĄĆĘŁŃŚŹŻ"  # Polish chars from wrong encoding
+    "âãäåæçèêë"  # Western European mojibake
+    "¡¢£¤¥¦§¨©"  # Symbol mojibake
+    "°±²³´µ¶·¸¹"  # More symbol mojibake
+)
+
+
+# Character classes in CHARACTER_CLASS_TABLE
+NEUTRAL_CLASS, CZECH_CLASS, MOJIBAKE_CLASS = 0, 1, 2
+
+
+@functools.lru_cache(maxsize=None)
+def _character_class_table() -> Any:
+    """
+    Lookup table from code point to character class.
+    
+    The table ends one past the highest classified code point; that last
+    entry is neutral and stands for every code point beyond the table.
+    """
+    import numpy as np
+    
+    table = np.zeros(max(map(ord, CZECH_CHARS | MOJIBAKE_CHARS)) + 2, dtype=np.uint8)
+    table[[ord(c) for c in CZECH_CHARS]] = CZECH_CLASS
+    table[[ord(c) for c in MOJIBAKE_CHARS]] = MOJIBAKE_CLASS
+    return table
+
+
+def count_czech_characters(text_sample: str) -> Tuple[int, int]:
+    """
+    Count Czech diacritics and typical mojibake characters in a text sample.
+    
+    Returns:
+        Tuple of (czech_count, mojibake_count)
+    """
+    import numpy as np
+    
+    # Classify all code points in one table lookup instead of looping over
+    # characters in Python, then count both classes in a single pass
+    table = _character_class_table()
+    codepoints = np.frombuffer(text_sample.encode('utf-32-le'), dtype=np.uint32)
+    classes = table[np.minimum(codepoints, len(table) - 1)]
+    counts = np.bincount(classes, minlength=3)
+    return int(counts[CZECH_CLASS]), int(counts[MOJIBAKE_CLASS])
 
 
 def score_czech_encoding(text_sample: str) -> float:
@@ -37,22 +118,13 @@ def score_czech_encoding(text_sample: str) -> float:
     if not text_sample:
         return 0.0
     
-    # Common Czech diacritics
-    czech_chars = "áčďéěíňóřšťúůýžÁČĎÉĚÍŇÓŘŠŤÚŮÝŽ"
-    
-    # Common mojibake patterns when Czech is wrongly decoded
-    mojibake_patterns = [
-        "Ą", "Ć", "Ę", "Ł", "Ń", "Ś", "Ź", "Ż",  # Polish chars from wrong encoding
-        "â", "ã", "ä", "å", "æ", "ç", "è", "ê", "ë",  # Western European mojibake
-        "¡", "¢", "£", "¤", "¥", "¦", "§", "¨", "©",  # Symbol mojibake
-        "°", "±", "²", "³", "´", "µ", "¶", "·", "¸", "¹"  # More symbol mojibake
-    ]
-    
     # Count good Czech characters vs mojibake
-    czech_count = sum(1 for char in text_sample if char in czech_chars)
-    mojibake_count = sum(1 for char in text_sample if char in mojibake_patterns)
-    total_chars = len(text_sample)
-    
+    czech_count, mojibake_count = count_czech_characters(text_sample)
+    return _score_from_counts(czech_count, mojibake_count, len(text_sample))
+
+
+def _score_from_counts(czech_count: int, mojibake_count: int, total_chars: int) -> float:
+    """Turn Czech/mojibake character counts into the 0-1 score used by score_czech_encoding."""
     if total_chars == 0:
         return 0.0
     
@@ -65,6 +137,73 @@ def score_czech_encoding(text_sample: str) -> float:
     return min(1.0, score)
 
 
+# DBF file header: version, last update (YY MM DD), record count,
+# header length and record length, followed by 20 reserved bytes
+DBF_HEADER = struct.Struct('<BBBBLHH20x')
+
+# DBF field descriptor: name, type, (4 reserved), length, decimal count, (14 reserved)
+DBF_FIELD_DESCRIPTOR = struct.Struct('<11sc4xBB14x')
+
+# Upper bound on the record bytes read for encoding detection
+DBF_SAMPLE_MAX_BYTES = 64 * 1024
+
+
+def read_dbf_sample(dbf_path: str, sample_size: int) -> Tuple[bytes, int]:
+    """
+    Read the raw character-field bytes of the first records of a DBF file.
+    
+    Only the header and field descriptors are parsed, so no records are
+    decoded here. Deleted records are skipped, as dbfread does, and only
+    character ('C') fields holding non-ASCII bytes are kept; codes and
+    numbers decode the same in every candidate encoding.
+    
+    Returns:
+        Tuple of (raw_text_bytes, record_count)
+    """
+    with open(dbf_path, 'rb') as f:
+        _, _, _, _, num_records, header_length, record_length = DBF_HEADER.unpack(
+            f.read(DBF_HEADER.size)
+        )
+        # A corrupt header would make the descriptor read below swallow the file
+        if header_length < DBF_HEADER.size or not record_length:
+            return b'', 0
+        descriptors = f.read(header_length - DBF_HEADER.size)
+        f.seek(header_length)
+        # Wide records are sampled fewer at a time, but at least one is read
+        max_records = max(1, DBF_SAMPLE_MAX_BYTES // record_length)
+        data = f.read(min(num_records, sample_size, max_records) * record_length)
+    
+    # Byte ranges of character fields within a record (after the deletion flag)
+    char_fields = []
+    offset = 1
+    for start in range(0, len(descriptors) - DBF_FIELD_DESCRIPTOR.size + 1, DBF_FIELD_DESCRIPTOR.size):
+        if descriptors[start] == 0x0D:
+            break
+        _, field_type, length, _ = DBF_FIELD_DESCRIPTOR.unpack_from(descriptors, start)
+        if field_type == b'C':
+            char_fields.append((offset, offset + length))
+        offset += length
+    
+    # Only live records (deletion flag b' ') count, as in _read_dbf_columns
+    records = [
+        data[i:i + record_length]
+        for i in range(0, len(data) - record_length + 1, record_length)
+        if data[i:i + 1] == b' '
+    ]
+    
+    columns = []
+    for start, end in char_fields:
+        column = b' '.join(record[start:end] for record in records)
+        if not column.isascii():
+            columns.append(column)
+    
+    return b' '.join(columns), len(records)
+
+
+# Czech code pages the DBF tables may use, in the order they are tried
+SUPPORTED_ENCODINGS = ('cp852', 'cp1250', 'iso-8859-2')
+
+
 def detect_dbf_encoding(dbf_path: str, sample_size: int = 100) -> Tuple[str, float, str]:
     """
     Detect the best encoding for a DBF file.
@@ -72,97 +211,404 @@ def detect_dbf_encoding(dbf_path: str, sample_size: int = 100) -> Tuple[str, flo
     Returns:
         Tuple of (best_encoding, confidence_score, detection_method)
     """
-    encodings_to_try = ['cp852', 'cp1250', 'iso-8859-2']
-    
-    # First, try chardet on raw file bytes
-    try:
-        with open(dbf_path, 'rb') as f:
-            raw_data = f.read(10000)  # Read first 10KB
-        detected = chardet.detect(raw_data)
-        chardet_encoding = detected.get('encoding', '').lower()
-        
-        # Map chardet results to our target encodings
-        if chardet_encoding in ['iso-8859-1', 'iso-8859-2']:
-            encodings_to_try.insert(0, 'iso-8859-2')
-        elif 'cp' in chardet_encoding or 'windows' in chardet_encoding:
-            encodings_to_try.insert(0, 'cp1250')
-    except Exception:
-        pass
+    encodings_to_try = list(SUPPORTED_ENCODINGS)
     
     best_encoding = 'cp852'  # Default fallback
     best_score = 0.0
     best_method = 'fallback'
     
-    # Try each encoding and score the results
+    try:
+        sample_data, record_count = read_dbf_sample(dbf_path, sample_size)
+    except (OSError, struct.error):
+        return best_encoding, best_score, best_method
+    
+    # Try each encoding on the same raw sample and score the results
     for encoding in encodings_to_try:
         try:
-            table = DBF(dbf_path, encoding=encoding, ignore_missing_memofile=True)
-            
-            # Collect sample text from first records
-            sample_texts = []
-            record_count = 0
-            
-            for record in table:
-                if record_count >= sample_size:
-                    break
-                
-                # Collect all string values from the record
-                for field_name, value in record.items():
-                    if isinstance(value, str) and len(value.strip()) > 0:
-                        sample_texts.append(value.strip())
-                
-                record_count += 1
-            
-            if sample_texts:
-                # Score the combined sample
-                combined_text = ' '.join(sample_texts)
-                score = score_czech_encoding(combined_text)
-                
-                if score > best_score:
-                    best_score = score
-                    best_encoding = encoding
-                    best_method = 'czech_scoring'
-                    
-        except Exception as e:
+            decoded = sample_data.decode(encoding, errors='strict')
+        except UnicodeDecodeError:
             # This encoding failed completely
             continue
+        
+        # Collapse the fixed-width field padding into single separators
+        combined_text = ' '.join(decoded.split())
+        if not combined_text:
+            continue
+        
+        # Score the combined sample
+        czech_count, mojibake_count = count_czech_characters(combined_text)
+        score = _score_from_counts(czech_count, mojibake_count, len(combined_text))
+        
+        if score > best_score:
+            best_score = score
+            best_encoding = encoding
+            best_method = 'czech_scoring'
+            
+            # A decode whose only non-ASCII characters are Czech diacritics,
+            # with plenty of them, will not be beaten by the remaining
+            # candidates, so skip scoring them
+            non_ascii_count = len(combined_text) - len(combined_text.encode('ascii', 'ignore'))
+            if czech_count == non_ascii_count and czech_count >= record_count:
+                break
     
     return best_encoding, best_score, best_method
 
 
+def _record_values(items: List[Tuple[str, object]]) -> tuple:
+    """Record factory for dbfread that keeps only the field values, in field order."""
+    return tuple(value for _, value in items)
+
+
+# Field types decoded column-wise by _read_dbf_columns; anything else goes
+# through dbfread's own record parser
+COLUMNAR_FIELD_TYPES = frozenset('CN')
+
+
+def _decode_character_column(raw: Any, encoding: str) -> Any:
+    """Decode a fixed-width bytes column the way dbfread decodes C fields."""
+    import numpy as np
+    
+    raw = np.ascontiguousarray(raw)
+    buffer = raw.tobytes()
+    text = buffer.decode(encoding)
+    if len(text) == len(buffer):
+        # Single-byte code page: decode the whole column in one call and
+        # view the result as fixed-width strings again
+        values = np.frombuffer(text.encode('utf-32-le'), dtype=f'<U{raw.dtype.itemsize}')
+    else:
+        values = np.char.decode(raw, encoding)
+    return np.char.rstrip(values, '\0 ').astype(object)
+
+
+def _parse_numeric_column(raw: Any) -> Any:
+    """Parse a fixed-width bytes column the way dbfread parses N fields."""
+    import numpy as np
+    import pandas as pd
+    
+    text = np.char.strip(np.char.strip(raw), b'*')
+    empty = text == b''
+    if not empty.any():
+        try:
+            return text.astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+    if empty.all():
+        return np.full(len(text), None, dtype=object)
+    values = pd.Series(np.char.decode(np.char.replace(text, b',', b'.'), 'ascii'), dtype=object)
+    values[empty] = None
+    return pd.to_numeric(values).to_numpy()
+
+
+def _read_dbf_columns(table: Any) -> pd.DataFrame:
+    """
+    Load a DBF table column by column from its raw record block.
+    
+    The records are viewed as a NumPy structured array, so each field is a
+    single bytes column that is decoded or parsed in one pass instead of
+    once per record.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    offsets = []
+    offset = 1  # the deletion flag comes first
+    for field in table.fields:
+        offsets.append(offset)
+        offset += field.length
+    layout = np.dtype({
+        'names': ['deleted'] + [f'f{i}' for i in range(len(table.fields))],
+        'formats': ['S1'] + [f'S{field.length}' for field in table.fields],
+        'offsets': [0] + offsets,
+        'itemsize': table.header.recordlen,
+    })
+    
+    with open(table.filename, 'rb') as f:
+        f.seek(table.header.headerlen)
+        data = f.read()
+    records = np.frombuffer(data, dtype=layout, count=len(data) // layout.itemsize)
+    
+    # Like dbfread: stop at the end-of-file marker and skip deleted records
+    flags = records['deleted']
+    eof = np.flatnonzero(flags == b'\x1a')
+    if eof.size:
+        records, flags = records[:eof[0]], flags[:eof[0]]
+    records = records[flags == b' ']
+    
+    columns = {}
+    for i, field in enumerate(table.fields):
+        raw = records[f'f{i}']
+        if field.type == 'C':
+            columns[field.name] = _decode_character_column(raw, table.encoding)
+        else:
+            columns[field.name] = _parse_numeric_column(raw)
+    return pd.DataFrame(columns, columns=table.field_names)
+
+
 def convert_dbf_to_dataframe(dbf_path: str, encoding: str) -> pd.DataFrame:
-    """Convert a DBF file to a pandas DataFrame with specified encoding."""
+    """
+    Convert a DBF file to a pandas DataFrame with specified encoding.
+    
+    Errors are raised to the caller, which reports them for the file.
+    """
+    import pandas as pd
+    from dbfread import DBF
+    
+    # Stream plain value tuples straight into the frame; the column names
+    # come from the DBF header, so no per-record dict is needed
+    table = DBF(
+        dbf_path,
+        encoding=encoding,
+        ignore_missing_memofile=True,
+        recfactory=_record_values
+    )
+    if all(field.type in COLUMNAR_FIELD_TYPES for field in table.fields):
+        return _read_dbf_columns(table)
+    return pd.DataFrame.from_records(iter(table), columns=table.field_names)
+
+
+# Number formats for date (D) and date-time (T, @) cells in xlsxwriter sheets
+EXCEL_DATE_FORMAT = 'yyyy-mm-dd'
+EXCEL_DATETIME_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+
+
+def create_excel_workbook(excel_path: Path) -> Any:
+    """
+    Create a streaming XLSX workbook for excel_path.
+    
+    Uses xlsxwriter in constant_memory mode when it is installed, otherwise
+    a write-only openpyxl workbook. Cell text is always stored literally,
+    never turned into formulas, URLs or numbers, and dates are shown as
+    dates rather than bare serial numbers.
+    """
+    xlsxwriter = optional_import('xlsxwriter')
+    if xlsxwriter is not None:
+        return xlsxwriter.Workbook(str(excel_path), {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+            'strings_to_numbers': False,
+            'default_date_format': EXCEL_DATE_FORMAT,
+        })
+    import openpyxl
+    return openpyxl.Workbook(write_only=True)
+
+
+def append_excel_sheet(workbook: Any, df: pd.DataFrame, sheet_name: str) -> None:
+    """
+    Stream a DataFrame into a new sheet of a workbook from create_excel_workbook.
+    
+    Rows go straight to the sheet's XML stream instead of being held as
+    cell objects, so memory stays flat however large the table is.
+    """
+    # Missing values become empty cells, as with DataFrame.to_excel
+    values = df.astype(object).where(df.notna(), None)
+    rows = values.itertuples(index=False, name=None)
+    
+    xlsxwriter = optional_import('xlsxwriter')
+    if xlsxwriter is not None and isinstance(workbook, xlsxwriter.Workbook):
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, list(df.columns))
+        
+        # Date-time columns keep their time of day; plain dates use the
+        # workbook's default date format
+        datetime_columns = [i for i, dtype in enumerate(df.dtypes) if dtype.kind == 'M']
+        datetime_format = workbook.add_format({'num_format': EXCEL_DATETIME_FORMAT}) if datetime_columns else None
+        
+        for row_index, row in enumerate(rows, start=1):
+            worksheet.write_row(row_index, 0, row)
+            # The row is still buffered in constant_memory mode, so its
+            # date-time cells can be rewritten with their format
+            for column_index in datetime_columns:
+                if row[column_index] is not None:
+                    worksheet.write_datetime(row_index, column_index, row[column_index], datetime_format)
+        return
+    
+    from openpyxl.cell import WriteOnlyCell
+    
+    def literal(value: Any) -> Any:
+        # openpyxl turns any string starting with '=' into a formula;
+        # pin such values to plain text, as xlsxwriter does
+        if isinstance(value, str) and value.startswith('='):
+            cell = WriteOnlyCell(worksheet, value)
+            cell.data_type = 's'
+            return cell
+        return value
+    
+    worksheet = workbook.create_sheet(title=sheet_name)
+    worksheet.append([literal(name) for name in df.columns])
+    for row in rows:
+        worksheet.append([literal(value) for value in row])
+
+
+def save_excel_workbook(workbook: Any, excel_path: Path) -> None:
+    """Finish writing a workbook from create_excel_workbook to excel_path."""
+    xlsxwriter = optional_import('xlsxwriter')
+    if xlsxwriter is not None and isinstance(workbook, xlsxwriter.Workbook):
+        workbook.close()
+    else:
+        workbook.save(excel_path)
+
+
+def _arrow_csv_compatible(df: pd.DataFrame) -> bool:
+    """
+    Whether pyarrow's CSV writer formats every column of df exactly like df.to_csv.
+    
+    That holds for string and plain integer columns only: pyarrow writes
+    integral floats as 12 instead of 12.0, booleans in lower case and adds
+    fractional seconds to datetimes. A single-column table is also left to
+    pandas, which quotes empty values there so the row is not blank.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if len(df.columns) < 2:
+        return False
+    for _, column in df.items():
+        dtype = column.dtype
+        if isinstance(dtype, pd.StringDtype) or (isinstance(dtype, np.dtype) and dtype.kind in 'iu'):
+            continue
+        if dtype == object and pd.api.types.infer_dtype(column, skipna=True) in ('string', 'empty'):
+            continue
+        return False
+    return True
+
+
+def write_csv(df: pd.DataFrame, csv_path: Path) -> None:
+    """
+    Write a DataFrame as a UTF-8 CSV file without the index.
+    
+    Uses pyarrow's CSV writer for the data rows when it is installed and
+    every column is a string or integer column, where its output is
+    identical to df.to_csv. Values are written unquoted; if a value would
+    need quoting, pyarrow refuses it and the pandas writer is used instead.
+    """
+    pyarrow = optional_import('pyarrow')
+    pyarrow_csv = optional_import('pyarrow.csv')
+    
+    if pyarrow is not None and pyarrow_csv is not None and _arrow_csv_compatible(df):
+        try:
+            with open(csv_path, 'wb') as f:
+                # pyarrow always quotes header names, so write the header here
+                header = io.StringIO()
+                csv.writer(header, lineterminator='\n').writerow(df.columns)
+                f.write(header.getvalue().encode('utf-8'))
+                
+                pyarrow_csv.write_csv(
+                    pyarrow.Table.from_pandas(df, preserve_index=False),
+                    f,
+                    write_options=pyarrow_csv.WriteOptions(
+                        include_header=False,
+                        quoting_style='none'
+                    )
+                )
+            return
+        except pyarrow.ArrowException:
+            # Raised for values that would need quoting; formatting
+            # differences are ruled out by _arrow_csv_compatible instead
+            pass
+    
+    df.to_csv(csv_path, index=False, encoding='utf-8')
+
+
+ENCODING_CACHE_FILENAME = ".encoding_cache.json"
+
+# Stored with every cache entry; bump it whenever detect_dbf_encoding can
+# return a different result, so entries from older detectors are redone
+ENCODING_DETECTOR_VERSION = 1
+
+
+def load_encoding_cache(cache_path: Path) -> Dict[str, Dict]:
+    """
+    Load previously detected encodings keyed by DBF member name.
+    
+    A missing or unreadable cache is treated as empty. Entries from another
+    detector version and malformed ones (not an object, an unsupported
+    encoding or a non-numeric score) are ignored, so those tables are
+    simply detected again.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        name: entry for name, entry in cache.items()
+        if isinstance(entry, dict)
+        and entry.get('detector') == ENCODING_DETECTOR_VERSION
+        and entry.get('encoding') in SUPPORTED_ENCODINGS
+        and isinstance(entry.get('score', 0.0), (int, float))
+    }
+
+
+def save_encoding_cache(cache_path: Path, cache: Dict[str, Dict]) -> None:
+    """Write the encoding cache atomically so an interrupted run never leaves it truncated."""
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write encoding cache {cache_path}: {e}")
+
+
+def _process_one_dbf(
+    task: Tuple[str, Optional[Tuple[str, float, str]], Path]
+) -> Tuple[str, float, str, Optional[pd.DataFrame], Optional[str]]:
+    """
+    Detect the encoding of one extracted DBF file (unless already known),
+    load it and write its CSV file.
+    
+    Runs in a worker process, so problems are reported back instead of printed.
+    
+    Returns:
+        Tuple of (encoding, score, detection_method, dataframe, error_message)
+    """
+    dbf_path, known_encoding, csv_path = task
+    
+    if known_encoding:
+        encoding, score, detection_method = known_encoding
+    else:
+        encoding, score, detection_method = detect_dbf_encoding(dbf_path)
+    
     try:
-        table = DBF(dbf_path, encoding=encoding, ignore_missing_memofile=True)
-        records = []
-        for record in table:
-            records.append(dict(record))
-        return pd.DataFrame(records)
+        df = convert_dbf_to_dataframe(dbf_path, encoding)
+        if not df.empty:
+            write_csv(df, csv_path)
     except Exception as e:
-        print(f"Error converting {dbf_path} with encoding {encoding}: {e}")
-        raise
+        return encoding, score, detection_method, None, str(e)
+    
+    return encoding, score, detection_method, df, None
 
 
 def process_dbf_files(
     zip_path: str,
     output_dir: str = "output",
-    force_encoding: Optional[str] = None
+    force_encoding: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, str]:
     """
     Process all DBF files in a ZIP archive.
     
+    Encoding detection, DBF loading and CSV writing run in parallel worker
+    processes; only the Excel workbook is written by the calling process.
+    
     Returns:
         Dictionary mapping DBF filenames to their detected/used encodings
     """
     os.makedirs(output_dir, exist_ok=True)
     
-    # Extract ZIP to temporary directory
-    temp_dir = Path(output_dir) / "temp_dbf"
-    temp_dir.mkdir(exist_ok=True)
-    
     encoding_summary = {}
     
-    try:
+    # Detected encodings from earlier runs, keyed by member name and
+    # validated against the CRC32 stored in the ZIP central directory
+    cache_path = Path(output_dir) / ENCODING_CACHE_FILENAME
+    encoding_cache = {} if force_encoding else load_encoding_cache(cache_path)
+    
+    # Extracted DBF files live in a scratch directory that is removed on exit
+    with tempfile.TemporaryDirectory(prefix='drd_dbf_') as temp_name:
+        temp_dir = Path(temp_name)
         with zipfile.ZipFile(zip_path, 'r') as zip_file:
             # Extract all DBF files
             dbf_files = [name for name in zip_file.namelist() if name.upper().endswith('.DBF')]
@@ -173,37 +619,75 @@ def process_dbf_files(
             
             print(f"Found {len(dbf_files)} DBF files in {zip_path}")
             
-            # Extract DBF files
-            for dbf_name in dbf_files:
-                zip_file.extract(dbf_name, temp_dir)
+            # Extract DBF files once; detection and conversion both read from temp_dir
+            zip_file.extractall(temp_dir, members=dbf_files)
+            
+            # Forced and cached encodings are resolved here; the rest is detected by the workers
+            dbf_names = sorted(dbf_files)
+            tasks = []
+            for dbf_name in dbf_names:
+                if force_encoding:
+                    known_encoding = (force_encoding, 1.0, 'manual_override')
+                else:
+                    zip_info = zip_file.getinfo(dbf_name)
+                    cached = encoding_cache.get(dbf_name, {})
+                    
+                    if (cached.get('crc') == zip_info.CRC
+                            and cached.get('file_size') == zip_info.file_size
+                            and 'encoding' in cached):
+                        known_encoding = (cached['encoding'], cached.get('score', 0.0), 'cache')
+                    else:
+                        known_encoding = None
+                
+                csv_path = Path(output_dir) / f"{Path(dbf_name).stem}.csv"
+                tasks.append((str(temp_dir / dbf_name), known_encoding, csv_path))
             
             # Create Excel workbook
             excel_path = Path(output_dir) / "drd_names.xlsx"
+            if max_workers is None:
+                max_workers = os.cpu_count() or 1
+            workers = min(len(tasks), max_workers)
             
-            with pd.ExcelWriter(excel_path, engine='openpyxl') as excel_writer:
+            workbook = create_excel_workbook(excel_path)
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                
+                results = executor.map(_process_one_dbf, tasks)
                 
-                for dbf_name in sorted(dbf_files):
-                    dbf_path = temp_dir / dbf_name
+                for dbf_name, result in zip(dbf_names, results):
+                    encoding, score, detection_method, df, error = result
                     base_name = Path(dbf_name).stem
                     
                     print(f"\nProcessing {dbf_name}...")
                     
-                    # Determine encoding
-                    if force_encoding:
-                        encoding = force_encoding
-                        detection_method = 'manual_override'
-                        score = 1.0
+                    if detection_method == 'manual_override':
                         print(f"  Using forced encoding: {encoding}")
+                    elif detection_method == 'cache':
+                        print(f"  Cached encoding: {encoding} (score: {score:.3f}, method: {detection_method})")
                     else:
-                        encoding, score, detection_method = detect_dbf_encoding(str(dbf_path))
                         print(f"  Detected encoding: {encoding} (score: {score:.3f}, method: {detection_method})")
+                        if detection_method == 'fallback':
+                            # Nothing was actually detected (e.g. an unreadable
+                            # sample), so try again on the next run
+                            encoding_cache.pop(dbf_name, None)
+                        else:
+                            zip_info = zip_file.getinfo(dbf_name)
+                            encoding_cache[dbf_name] = {
+                                'crc': zip_info.CRC,
+                                'file_size': zip_info.file_size,
+                                'encoding': encoding,
+                                'score': score,
+                                'detector': ENCODING_DETECTOR_VERSION,
+                            }
                     
                     encoding_summary[dbf_name] = encoding
                     
-                    # Convert to DataFrame
+                    if error:
+                        print(f"  Error processing {dbf_name}: {error}")
+                        encoding_summary[dbf_name] += f" (ERROR: {error})"
+                        continue
+                    
                     try:
-                        df = convert_dbf_to_dataframe(str(dbf_path), encoding)
-                        
                         if df.empty:
                             print(f"  Warning: {dbf_name} is empty")
                             continue
@@ -212,29 +696,35 @@ def process_dbf_files(
                         
                         # Add to Excel workbook
                         sheet_name = base_name[:31]  # Excel sheet name limit
-                        df.to_excel(excel_writer, sheet_name=sheet_name, index=False)
+                        append_excel_sheet(workbook, df, sheet_name)
                         
-                        # Save as CSV
                         csv_path = Path(output_dir) / f"{base_name}.csv"
-                        df.to_csv(csv_path, index=False, encoding='utf-8')
-                        
                         print(f"  Saved to Excel sheet '{sheet_name}' and {csv_path}")
                         
                     except Exception as e:
                         print(f"  Error processing {dbf_name}: {e}")
                         encoding_summary[dbf_name] += f" (ERROR: {e})"
             
+            save_excel_workbook(workbook, excel_path)
             print(f"\nExcel workbook saved to: {excel_path}")
             
-    finally:
-        # Clean up temporary files
-        import shutil
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+            if not force_encoding:
+                save_encoding_cache(cache_path, encoding_cache)
     
     return encoding_summary
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert DBF files to Excel and CSV with proper Czech diacritics"
@@ -250,9 +740,15 @@ def main():
     )
     parser.add_argument(
         "--encoding", "-e",
-        choices=['cp852', 'cp1250', 'iso-8859-2'],
+        choices=SUPPORTED_ENCODINGS,
         help="Force specific encoding for all DBF files (overrides auto-detection)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes for reading DBF files (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
@@ -260,6 +756,8 @@ def main():
         print(f"Error: ZIP file not found: {args.zip_file}")
         sys.exit(1)
     
+    check_dependencies()
+    
     print(f"Converting DBF files from: {args.zip_file}")
     print(f"Output directory: {args.output_dir}")
     
@@ -272,7 +770,8 @@ def main():
         encoding_summary = process_dbf_files(
             args.zip_file,
             args.output_dir,
-            args.encoding
+            args.encoding,
+            args.jobs
         )
         
         print("\n" + "="*60)